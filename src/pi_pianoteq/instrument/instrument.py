@@ -4,6 +4,7 @@ from pi_pianoteq.instrument.preset import Preset
 
 
 class Instrument:
+    __slots__ = ('name', 'preset_prefix', 'background_primary', 'background_secondary', 'presets')
 
     def __init__(self, name: str, preset_prefix: str, bg_primary: str, bg_secondary: str):
         self.name = name
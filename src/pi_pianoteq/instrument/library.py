@@ -17,6 +17,23 @@ class Library:
                         (typically from Config.discover_instruments_from_api())
         """
         self.instruments: List[Instrument] = instruments
+        self._preset_index: Dict[str, tuple[Instrument, Preset]] = {}
+        self._preset_index_ci: Dict[str, tuple[Instrument, Preset]] = {}
+        self.reindex()
+
+    def reindex(self) -> None:
+        """
+        Rebuild the preset name index.
+
+        Call this after mutating the presets of any instrument in the library.
+        """
+        self._preset_index = {}
+        self._preset_index_ci = {}
+        for instrument in self.instruments:
+            for preset in instrument.presets:
+                # First match wins, as with a front-to-back scan
+                self._preset_index.setdefault(preset.name, (instrument, preset))
+                self._preset_index_ci.setdefault(preset.name.casefold(), (instrument, preset))
 
     def get_instruments(self) -> List[Instrument]:
         return [i for i in self.instruments if len(i.presets) > 0]
@@ -31,8 +48,16 @@ class Library:
         Returns:
             Tuple of (Instrument, Preset) if found, None otherwise
         """
-        for instrument in self.get_instruments():
-            for preset in instrument.presets:
-                if preset.name == preset_name:
-                    return (instrument, preset)
-        return None
+        return self._preset_index.get(preset_name)
+
+    def find_preset_by_name_ci(self, preset_name: str) -> tuple[Instrument, Preset] | None:
+        """
+        Find a preset by name across all instruments, ignoring case.
+
+        Args:
+            preset_name: The preset name to search for, in any case
+
+        Returns:
+            Tuple of (Instrument, Preset) if found, None otherwise
+        """
+        return self._preset_index_ci.get(preset_name.casefold())
@@ -2,6 +2,8 @@ from typing import Optional
 
 
 class Preset:
+    __slots__ = ('name', 'display_name')
+
     def __init__(self, name: str, display_name: Optional[str] = None):
         """
         Create a Preset instance.
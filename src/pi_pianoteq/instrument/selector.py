@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Tuple
 from pi_pianoteq.instrument.instrument import Instrument, Preset
 
 
@@ -7,10 +7,28 @@ class Selector:
         self.instruments: List[Instrument] = instruments
         self.current_instrument_idx: int = 0
         self.current_instrument_preset_idx: int = 0
+        self._by_name: Dict[str, Tuple[int, Dict[str, int]]] = {}
+        self.reindex()
+
+    def reindex(self) -> None:
+        """
+        Rebuild the instrument and preset name indexes.
+
+        Call this after mutating the instruments or their presets.
+        """
+        self._by_name = {}
+        for i, instrument in enumerate(self.instruments):
+            if instrument.name in self._by_name:
+                continue  # First match wins, as with a front-to-back scan
+            preset_idx: Dict[str, int] = {}
+            for j, preset in enumerate(instrument.presets):
+                preset_idx.setdefault(preset.name, j)
+            self._by_name[instrument.name] = (i, preset_idx)
 
     def get_instrument_by_name(self, name: str) -> Instrument | None:
         """Find instrument by name."""
-        return next((i for i in self.instruments if i.name == name), None)
+        entry = self._by_name.get(name)
+        return self.instruments[entry[0]] if entry else None
 
     def get_current_instrument(self) -> Instrument:
         return self.instruments[self.current_instrument_idx]
@@ -24,9 +42,9 @@ class Selector:
         self.current_instrument_preset_idx = 0
 
     def set_instrument(self, name) -> None:
-        instrument = self.get_instrument_by_name(name)
-        if instrument is not None:
-            self.current_instrument_idx = self.instruments.index(instrument)
+        entry = self._by_name.get(name)
+        if entry is not None:
+            self.current_instrument_idx = entry[0]
             self.current_instrument_preset_idx = 0
 
     def get_current_preset(self) -> Preset:
@@ -51,14 +69,15 @@ class Selector:
 
         Returns True if successful, False if instrument or preset not found.
         """
-        instrument = self.get_instrument_by_name(instrument_name)
-        if not instrument:
+        entry = self._by_name.get(instrument_name)
+        if entry is None:
             return False
 
-        preset = next((p for p in instrument.presets if p.name == preset_name), None)
-        if not preset:
+        instrument_idx, preset_idx = entry
+        preset_pos = preset_idx.get(preset_name)
+        if preset_pos is None:
             return False
 
-        self.current_instrument_idx = self.instruments.index(instrument)
-        self.current_instrument_preset_idx = instrument.presets.index(preset)
+        self.current_instrument_idx = instrument_idx
+        self.current_instrument_preset_idx = preset_pos
         return True
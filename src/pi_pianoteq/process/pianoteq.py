@@ -1,6 +1,5 @@
 import logging
 import subprocess
-import time
 from os.path import expanduser
 from typing import List, Optional
 
@@ -67,12 +66,9 @@ class Pianoteq:
                     pass
 
                 # Wait for process to exit gracefully
-                start_time = time.time()
-                while time.time() - start_time < timeout:
-                    if self.process.poll() is not None:
-                        logger.info("Pianoteq exited gracefully")
-                        return
-                    time.sleep(0.1)
+                if self._wait_for_exit(timeout):
+                    logger.info("Pianoteq exited gracefully")
+                    return
 
                 logger.warning(f"Pianoteq did not exit within {timeout}s after quit command")
             except Exception as e:
@@ -98,15 +94,20 @@ class Pianoteq:
         self.process.terminate()
 
         # Wait for process to exit
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if self.process.poll() is not None:
-                logger.info("Pianoteq process terminated")
-                return
-            time.sleep(0.1)
+        if self._wait_for_exit(timeout):
+            logger.info("Pianoteq process terminated")
+            return
 
         # Force kill if still running
         logger.warning(f"Pianoteq did not terminate within {timeout}s, sending SIGKILL")
         self.process.kill()
         self.process.wait()
         logger.info("Pianoteq process killed")
+
+    def _wait_for_exit(self, timeout: float) -> bool:
+        """Wait up to timeout seconds for the process to exit. Returns True if it exited."""
+        try:
+            self.process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return False
+        return True
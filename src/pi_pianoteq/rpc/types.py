@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 from typing import Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class PresetInfo:
     """Full preset information from getListOfPresets().
 
@@ -34,7 +34,7 @@ class PresetInfo:
         return cls(**data_copy)
 
 
-@dataclass
+@dataclass(slots=True)
 class MiniPresetInfo:
     """Mini-preset information from getListOfPresets(preset_type=...).
 
@@ -47,7 +47,7 @@ class MiniPresetInfo:
     file: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CurrentPreset:
     """Current preset information (nested in PianoteqInfo)."""
     name: str = ""
@@ -58,7 +58,7 @@ class CurrentPreset:
     mini_presets: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PianoteqInfo:
     """Pianoteq state information from getInfo().
 
@@ -85,7 +85,7 @@ class PianoteqInfo:
         return cls(**data_copy)
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivationInfo:
     """License and activation information from getActivationInfo().
 
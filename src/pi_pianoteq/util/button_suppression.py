@@ -10,19 +10,21 @@ class ButtonSuppression:
     brushes the action button while pressing other buttons.
     """
 
-    def __init__(self, threshold_ms=300):
+    def __init__(self, threshold_ms=300, clock=time.monotonic_ns):
         """
         Initialize suppression window.
 
         Args:
             threshold_ms: Suppression window duration in milliseconds
+            clock: Monotonic clock returning nanoseconds (injectable for tests)
         """
         self.threshold_ms = threshold_ms
-        self.last_trigger_time = 0
+        self._clock = clock
+        self.last_trigger_ns = None
 
     def record(self):
         """Open a suppression window by recording a trigger button press timestamp."""
-        self.last_trigger_time = time.time()
+        self.last_trigger_ns = self._clock()
 
     def allow_action(self):
         """
@@ -31,5 +33,6 @@ class ButtonSuppression:
         Returns:
             True if action should be allowed, False if still suppressed
         """
-        elapsed_ms = (time.time() - self.last_trigger_time) * 1000
-        return elapsed_ms >= self.threshold_ms
+        if self.last_trigger_ns is None:
+            return True
+        return self._clock() - self.last_trigger_ns >= self.threshold_ms * 1_000_000
@@ -1,6 +1,12 @@
 """Utilities for processing preset names and calculating display names."""
 
-import re
+# Non-whitespace word separators; str.split() handles the whitespace ones
+_SEPARATORS = str.maketrans(dict.fromkeys('-—:|\u2013', ' '))
+
+
+def _split_words(name: str) -> list[str]:
+    """Split a preset name into words on whitespace, hyphens, dashes, colons and pipes."""
+    return name.translate(_SEPARATORS).split()
 
 
 def find_longest_common_word_prefix(names: list[str]) -> str:
@@ -18,17 +24,14 @@ def find_longest_common_word_prefix(names: list[str]) -> str:
     if not names or len(names) == 1:
         return names[0] if names else ""
 
-    separator_pattern = r'[\s\-—:|\u2013\u2014]+'
-
-    tokenized = [re.split(separator_pattern, name.strip()) for name in names]
+    tokenized = [_split_words(name) for name in names]
 
     common_prefix = []
-    for i in range(min(len(tokens) for tokens in tokenized)):
-        words_at_position = [tokens[i].lower() for tokens in tokenized]
-        if len(set(words_at_position)) == 1:
-            common_prefix.append(tokenized[0][i])
-        else:
+    for words_at_position in zip(*tokenized):
+        first = words_at_position[0].lower()
+        if any(word.lower() != first for word in words_at_position[1:]):
             break
+        common_prefix.append(words_at_position[0])
 
     return ' '.join(common_prefix)
 
@@ -47,11 +50,9 @@ def calculate_display_name(preset_name: str, common_prefix: str) -> str:
     if not common_prefix:
         return preset_name[0].upper() + preset_name[1:] if len(preset_name) > 1 else preset_name.upper()
 
-    separator_pattern = r'[\s\-—:|\u2013\u2014]+'
-
     # Tokenize both the preset name and prefix
-    preset_tokens = re.split(separator_pattern, preset_name.strip())
-    prefix_tokens = re.split(separator_pattern, common_prefix.strip())
+    preset_tokens = _split_words(preset_name)
+    prefix_tokens = _split_words(common_prefix)
 
     # Check if preset starts with prefix (case-insensitive token comparison)
     if len(preset_tokens) < len(prefix_tokens):
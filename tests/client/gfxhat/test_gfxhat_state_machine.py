@@ -1,15 +1,11 @@
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 
 from pi_pianoteq.client.gfxhat.gfxhat_client import GfxhatClient
 from pi_pianoteq.instrument.instrument import Instrument
 from pi_pianoteq.instrument.preset import Preset
 
 
-@patch('pi_pianoteq.client.gfxhat.gfxhat_client.fonts')
-@patch('pi_pianoteq.client.gfxhat.gfxhat_client.backlight')
-@patch('pi_pianoteq.client.gfxhat.gfxhat_client.lcd')
-@patch('pi_pianoteq.client.gfxhat.gfxhat_client.touch')
 class GfxhatClientStateMachineTestCase(unittest.TestCase):
     """
     Tests for GfxhatClient state machine.
@@ -26,6 +22,22 @@ class GfxhatClientStateMachineTestCase(unittest.TestCase):
 
     def setUp(self):
         """Set up common test fixtures."""
+        touch_patcher = patch('pi_pianoteq.client.gfxhat.gfxhat_client.touch')
+        self.mock_touch = touch_patcher.start()
+        self.addCleanup(touch_patcher.stop)
+        lcd_patcher = patch('pi_pianoteq.client.gfxhat.gfxhat_client.lcd')
+        self.mock_lcd = lcd_patcher.start()
+        self.addCleanup(lcd_patcher.stop)
+        backlight_patcher = patch('pi_pianoteq.client.gfxhat.gfxhat_client.backlight')
+        self.mock_backlight = backlight_patcher.start()
+        self.addCleanup(backlight_patcher.stop)
+        fonts_patcher = patch('pi_pianoteq.client.gfxhat.gfxhat_client.fonts')
+        self.mock_fonts = fonts_patcher.start()
+        self.addCleanup(fonts_patcher.stop)
+
+        self.mock_lcd.dimensions.return_value = (128, 64)
+        self.mock_fonts.BitbuntuFull = "/fake/font.ttf"
+
         self.mock_api = Mock()
         self.mock_api.get_current_instrument.return_value = Instrument("Piano", "Piano", "#FF0000", "#0000FF")
         self.mock_api.get_current_preset.return_value = Preset("Piano - Bright", "Bright")
@@ -38,11 +50,8 @@ class GfxhatClientStateMachineTestCase(unittest.TestCase):
             Preset("Piano - Dark", "Dark")
         ]
 
-    def test_loading_mode_initialization(self, mock_touch, mock_lcd, mock_backlight, mock_fonts):
+    def test_loading_mode_initialization(self):
         """Client should start in loading mode when api=None."""
-        mock_lcd.dimensions.return_value = (128, 64)
-        mock_fonts.BitbuntuFull = "/fake/font.ttf"
-
         client = GfxhatClient(api=None)
 
         self.assertTrue(client.loading_mode)
@@ -52,11 +61,8 @@ class GfxhatClientStateMachineTestCase(unittest.TestCase):
         self.assertIsNone(client.preset_menu_display)
         self.assertIsNotNone(client.loading_display)
 
-    def test_normal_mode_initialization(self, mock_touch, mock_lcd, mock_backlight, mock_fonts):
+    def test_normal_mode_initialization(self):
         """Client should initialize displays when api provided."""
-        mock_lcd.dimensions.return_value = (128, 64)
-        mock_fonts.BitbuntuFull = "/fake/font.ttf"
-
         client = GfxhatClient(api=self.mock_api)
 
         self.assertFalse(client.loading_mode)
@@ -65,23 +71,17 @@ class GfxhatClientStateMachineTestCase(unittest.TestCase):
         self.assertIsNotNone(client.menu_display)
         self.mock_api.set_on_exit.assert_called_once()
 
-    def test_get_display_in_loading_mode(self, mock_touch, mock_lcd, mock_backlight, mock_fonts):
+    def test_get_display_in_loading_mode(self):
         """get_display() should return loading display in loading mode."""
-        mock_lcd.dimensions.return_value = (128, 64)
-        mock_fonts.BitbuntuFull = "/fake/font.ttf"
-
         client = GfxhatClient(api=None)
 
         self.assertEqual(client.loading_display, client.get_display())
 
-    def test_get_display_priority(self, mock_touch, mock_lcd, mock_backlight, mock_fonts):
+    def test_get_display_priority(self):
         """
         get_display() should return displays in priority order:
         preset menu > instrument menu > control menu > main display
         """
-        mock_lcd.dimensions.return_value = (128, 64)
-        mock_fonts.BitbuntuFull = "/fake/font.ttf"
-
         client = GfxhatClient(api=self.mock_api)
 
         # Default: main display
@@ -100,11 +100,8 @@ class GfxhatClientStateMachineTestCase(unittest.TestCase):
         client.preset_menu_display = Mock()
         self.assertEqual(client.preset_menu_display, client.get_display())
 
-    def test_on_enter_control_menu_transitions_state(self, mock_touch, mock_lcd, mock_backlight, mock_fonts):
+    def test_on_enter_control_menu_transitions_state(self):
         """Opening control menu should transition state correctly."""
-        mock_lcd.dimensions.return_value = (128, 64)
-        mock_fonts.BitbuntuFull = "/fake/font.ttf"
-
         client = GfxhatClient(api=self.mock_api)
 
         # Mock the displays to track method calls
@@ -117,11 +114,8 @@ class GfxhatClientStateMachineTestCase(unittest.TestCase):
         client.instrument_display.stop_scrolling.assert_called_once()
         client.control_menu_display.start_scrolling.assert_called_once()
 
-    def test_on_exit_control_menu_returns_to_main(self, mock_touch, mock_lcd, mock_backlight, mock_fonts):
+    def test_on_exit_control_menu_returns_to_main(self):
         """Exiting control menu should return to main display."""
-        mock_lcd.dimensions.return_value = (128, 64)
-        mock_fonts.BitbuntuFull = "/fake/font.ttf"
-
         client = GfxhatClient(api=self.mock_api)
         client.control_menu_open = True
 
@@ -137,11 +131,8 @@ class GfxhatClientStateMachineTestCase(unittest.TestCase):
         client.instrument_display.update_display.assert_called_once()
         client.instrument_display.start_scrolling.assert_called_once()
 
-    def test_on_enter_instrument_menu_transitions_state(self, mock_touch, mock_lcd, mock_backlight, mock_fonts):
+    def test_on_enter_instrument_menu_transitions_state(self):
         """Opening instrument menu from control menu should transition state correctly."""
-        mock_lcd.dimensions.return_value = (128, 64)
-        mock_fonts.BitbuntuFull = "/fake/font.ttf"
-
         client = GfxhatClient(api=self.mock_api)
         client.control_menu_open = True
 
@@ -157,11 +148,8 @@ class GfxhatClientStateMachineTestCase(unittest.TestCase):
         client.menu_display.update_instrument.assert_called_once()
         client.menu_display.start_scrolling.assert_called_once()
 
-    def test_on_exit_instrument_menu_back_returns_to_control_menu(self, mock_touch, mock_lcd, mock_backlight, mock_fonts):
+    def test_on_exit_instrument_menu_back_returns_to_control_menu(self):
         """Pressing BACK in instrument menu should return to control menu."""
-        mock_lcd.dimensions.return_value = (128, 64)
-        mock_fonts.BitbuntuFull = "/fake/font.ttf"
-
         client = GfxhatClient(api=self.mock_api)
         client.instrument_menu_open = True
         client.control_menu_open = True
@@ -180,11 +168,8 @@ class GfxhatClientStateMachineTestCase(unittest.TestCase):
         # Should not update main display
         client.instrument_display.update_display.assert_not_called()
 
-    def test_instrument_selected_closes_all_menus(self, mock_touch, mock_lcd, mock_backlight, mock_fonts):
+    def test_instrument_selected_closes_all_menus(self):
         """Selecting an instrument should close all menus and return to main display."""
-        mock_lcd.dimensions.return_value = (128, 64)
-        mock_fonts.BitbuntuFull = "/fake/font.ttf"
-
         client = GfxhatClient(api=self.mock_api)
         client.instrument_menu_open = True
         client.control_menu_open = True
@@ -209,12 +194,8 @@ class GfxhatClientStateMachineTestCase(unittest.TestCase):
         client.instrument_display.start_scrolling.assert_called_once()
 
     @patch('pi_pianoteq.client.gfxhat.gfxhat_client.PresetMenuDisplay')
-    def test_preset_menu_from_main_display(self, mock_preset_menu_class,
-                                           mock_touch, mock_lcd, mock_backlight, mock_fonts):
+    def test_preset_menu_from_main_display(self, mock_preset_menu_class):
         """Long press ENTER on main display should open preset menu for current instrument."""
-        mock_lcd.dimensions.return_value = (128, 64)
-        mock_fonts.BitbuntuFull = "/fake/font.ttf"
-
         client = GfxhatClient(api=self.mock_api)
         client.instrument_display.stop_scrolling = Mock()
 
@@ -241,12 +222,8 @@ class GfxhatClientStateMachineTestCase(unittest.TestCase):
         mock_preset_menu.start_scrolling.assert_called_once()
 
     @patch('pi_pianoteq.client.gfxhat.gfxhat_client.PresetMenuDisplay')
-    def test_preset_menu_from_instrument_menu(self, mock_preset_menu_class,
-                                              mock_touch, mock_lcd, mock_backlight, mock_fonts):
+    def test_preset_menu_from_instrument_menu(self, mock_preset_menu_class):
         """Long press ENTER on instrument menu should open preset menu for highlighted instrument."""
-        mock_lcd.dimensions.return_value = (128, 64)
-        mock_fonts.BitbuntuFull = "/fake/font.ttf"
-
         client = GfxhatClient(api=self.mock_api)
         client.menu_display.stop_scrolling = Mock()
 
@@ -266,11 +243,8 @@ class GfxhatClientStateMachineTestCase(unittest.TestCase):
         # Should track source as instrument_menu
         self.assertEqual('instrument_menu', client.preset_menu_source)
 
-    def test_exit_preset_menu_returns_to_main(self, mock_touch, mock_lcd, mock_backlight, mock_fonts):
+    def test_exit_preset_menu_returns_to_main(self):
         """Exiting preset menu from main display should return to main display."""
-        mock_lcd.dimensions.return_value = (128, 64)
-        mock_fonts.BitbuntuFull = "/fake/font.ttf"
-
         client = GfxhatClient(api=self.mock_api)
         client.preset_menu_open = True
         client.preset_menu_source = 'main'
@@ -286,11 +260,8 @@ class GfxhatClientStateMachineTestCase(unittest.TestCase):
         client.instrument_display.update_display.assert_called_once()
         client.instrument_display.start_scrolling.assert_called_once()
 
-    def test_exit_preset_menu_returns_to_instrument_menu(self, mock_touch, mock_lcd, mock_backlight, mock_fonts):
+    def test_exit_preset_menu_returns_to_instrument_menu(self):
         """Exiting preset menu from instrument menu should return to instrument menu."""
-        mock_lcd.dimensions.return_value = (128, 64)
-        mock_fonts.BitbuntuFull = "/fake/font.ttf"
-
         client = GfxhatClient(api=self.mock_api)
         client.preset_menu_open = True
         client.preset_menu_source = 'instrument_menu'
@@ -309,11 +280,8 @@ class GfxhatClientStateMachineTestCase(unittest.TestCase):
         client.menu_display.start_scrolling.assert_called_once()
         client.instrument_display.update_display.assert_not_called()
 
-    def test_cleanup_stops_all_scrolling(self, mock_touch, mock_lcd, mock_backlight, mock_fonts):
+    def test_cleanup_stops_all_scrolling(self):
         """cleanup() should stop scrolling on all displays."""
-        mock_lcd.dimensions.return_value = (128, 64)
-        mock_fonts.BitbuntuFull = "/fake/font.ttf"
-
         client = GfxhatClient(api=self.mock_api)
 
         # Mock stop_scrolling on all displays
@@ -331,11 +299,8 @@ class GfxhatClientStateMachineTestCase(unittest.TestCase):
         client.preset_menu_display.stop_scrolling.assert_called_once()
         self.assertTrue(client.interrupt)
 
-    def test_cleanup_handles_uninitialized_displays(self, mock_touch, mock_lcd, mock_backlight, mock_fonts):
+    def test_cleanup_handles_uninitialized_displays(self):
         """cleanup() should handle None displays gracefully."""
-        mock_lcd.dimensions.return_value = (128, 64)
-        mock_fonts.BitbuntuFull = "/fake/font.ttf"
-
         client = GfxhatClient(api=None)
 
         # Should not raise error when displays are None
@@ -346,11 +311,8 @@ class GfxhatClientStateMachineTestCase(unittest.TestCase):
 
         self.assertTrue(client.interrupt)
 
-    def test_preset_selected_closes_all_menus(self, mock_touch, mock_lcd, mock_backlight, mock_fonts):
+    def test_preset_selected_closes_all_menus(self):
         """When preset selected from instrument menu, all menus should close."""
-        mock_lcd.dimensions.return_value = (128, 64)
-        mock_fonts.BitbuntuFull = "/fake/font.ttf"
-
         client = GfxhatClient(api=self.mock_api)
 
         # Open control menu
@@ -390,11 +352,8 @@ class GfxhatClientStateMachineTestCase(unittest.TestCase):
         client.instrument_display.update_display.assert_called_once()
         client.instrument_display.start_scrolling.assert_called_once()
 
-    def test_preset_back_button_returns_to_instrument_menu(self, mock_touch, mock_lcd, mock_backlight, mock_fonts):
+    def test_preset_back_button_returns_to_instrument_menu(self):
         """When BACK pressed in preset menu from instrument menu, should return to instrument menu."""
-        mock_lcd.dimensions.return_value = (128, 64)
-        mock_fonts.BitbuntuFull = "/fake/font.ttf"
-
         client = GfxhatClient(api=self.mock_api)
 
         # Open instrument menu
@@ -426,11 +385,8 @@ class GfxhatClientStateMachineTestCase(unittest.TestCase):
         client.instrument_display.update_display.assert_not_called()
         client.menu_display.stop_scrolling.assert_not_called()
 
-    def test_preset_back_button_returns_to_main_from_main(self, mock_touch, mock_lcd, mock_backlight, mock_fonts):
+    def test_preset_back_button_returns_to_main_from_main(self):
         """When BACK pressed in preset menu from main display, should return to main display."""
-        mock_lcd.dimensions.return_value = (128, 64)
-        mock_fonts.BitbuntuFull = "/fake/font.ttf"
-
         client = GfxhatClient(api=self.mock_api)
 
         # Preset menu opened from main display
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 
 from pi_pianoteq.client.gfxhat.preset_menu_display import PresetMenuDisplay
 from pi_pianoteq.instrument.preset import Preset
@@ -23,6 +23,11 @@ class PresetMenuDisplayTestCase(unittest.TestCase):
         self.mock_font.getbbox.return_value = (0, 0, 50, 10)
         self.mock_on_exit = Mock()
 
+        scroller_patcher = patch('pi_pianoteq.client.gfxhat.menu_display.ScrollingText')
+        mock_scroller_class = scroller_patcher.start()
+        self.addCleanup(scroller_patcher.stop)
+        self._configure_scroller_mock(mock_scroller_class)
+
     def _configure_scroller_mock(self, mock_scroller_class):
         """Configure ScrollingText mock to return proper values."""
         mock_scroller = Mock()
@@ -31,22 +36,21 @@ class PresetMenuDisplayTestCase(unittest.TestCase):
         mock_scroller_class.return_value = mock_scroller
         return mock_scroller
 
-    @patch('pi_pianoteq.client.gfxhat.menu_display.ScrollingText')
-    @patch('PIL.ImageDraw.Draw')
-    @patch('PIL.Image.new')
-    def test_get_menu_options_creates_options_from_api(self, mock_image, mock_draw, mock_scroller_class):
+    def _make_menu(self, instrument_name="Piano"):
+        return PresetMenuDisplay(
+            self.mock_api, 128, 64, self.mock_font,
+            self.mock_on_exit, instrument_name
+        )
+
+    def test_get_menu_options_creates_options_from_api(self):
         """Menu options should include all presets."""
-        self._configure_scroller_mock(mock_scroller_class)
         self.mock_api.get_presets.return_value = [
             Preset("Bright", "Bright"),
             Preset("Dark", "Dark"),
             Preset("Medium", "Medium")
         ]
 
-        menu = PresetMenuDisplay(
-            self.mock_api, 128, 64, self.mock_font,
-            self.mock_on_exit, "Piano"
-        )
+        menu = self._make_menu()
 
         # Should create 3 menu options from presets
         self.assertEqual(3, len(menu.menu_options))
@@ -54,21 +58,14 @@ class PresetMenuDisplayTestCase(unittest.TestCase):
         self.assertEqual("Dark", menu.menu_options[1].name)
         self.assertEqual("Medium", menu.menu_options[2].name)
 
-    @patch('pi_pianoteq.client.gfxhat.menu_display.ScrollingText')
-    @patch('PIL.ImageDraw.Draw')
-    @patch('PIL.Image.new')
-    def test_set_preset_calls_api_and_exits(self, mock_image, mock_draw, mock_scroller):
+    def test_set_preset_calls_api_and_exits(self):
         """Selecting a preset should call API and trigger exit callback."""
-        self._configure_scroller_mock(mock_scroller)
         self.mock_api.get_presets.return_value = [
             Preset("Bright", "Bright"),
             Preset("Dark", "Dark")
         ]
 
-        menu = PresetMenuDisplay(
-            self.mock_api, 128, 64, self.mock_font,
-            self.mock_on_exit, "Piano"
-        )
+        menu = self._make_menu()
 
         menu.set_preset("Dark")
 
@@ -77,137 +74,59 @@ class PresetMenuDisplayTestCase(unittest.TestCase):
         # Should trigger exit callback
         self.mock_on_exit.assert_called_once()
 
-    @patch('pi_pianoteq.client.gfxhat.menu_display.ScrollingText')
-    @patch('PIL.ImageDraw.Draw')
-    @patch('PIL.Image.new')
-    def test_current_preset_highlighted_for_current_instrument(self, mock_image, mock_draw, mock_scroller):
+    def test_initial_position_follows_current_preset(self):
         """
-        Current preset should be highlighted when viewing current instrument.
+        Current preset should be highlighted only when viewing the current instrument.
 
-        If user is viewing presets for the currently loaded instrument,
-        the menu should automatically position on the current preset.
+        If the user is viewing presets for the currently loaded instrument, the
+        menu positions on the current preset. When browsing a different
+        instrument, or if the current preset is missing from the list (the API
+        returned inconsistent data), it starts at the first preset.
         """
-        self._configure_scroller_mock(mock_scroller)
-        self.mock_api.get_current_instrument.return_value = Instrument("Piano", "Piano", "#000000", "#FFFFFF")
-        self.mock_api.get_current_preset.return_value = Preset("Medium", "Medium")
-        self.mock_api.get_presets.return_value = [
-            Preset("Bright", "Bright"),
-            Preset("Dark", "Dark"),
-            Preset("Medium", "Medium"),
-            Preset("Soft", "Soft")
+        cases = [
+            # (description, current preset, presets, viewing instrument, expected index)
+            ("current instrument", "Medium", ["Bright", "Dark", "Medium", "Soft"], "Piano", 2),
+            ("different instrument", "Medium", ["Plucked", "Muted", "Sustained"], "Strings", 0),
+            ("current preset not in list", "NonExistent", ["Bright", "Dark", "Medium"], "Piano", 0),
         ]
-
-        menu = PresetMenuDisplay(
-            self.mock_api, 128, 64, self.mock_font,
-            self.mock_on_exit, "Piano"  # Viewing current instrument
-        )
-
-        # Should position on "Medium" (index 2: Bright, Dark, Medium)
-        self.assertEqual(2, menu.current_menu_option)
-
-    @patch('pi_pianoteq.client.gfxhat.menu_display.ScrollingText')
-    @patch('PIL.ImageDraw.Draw')
-    @patch('PIL.Image.new')
-    def test_no_highlighting_for_different_instrument(self, mock_image, mock_draw, mock_scroller):
-        """
-        Current preset should NOT be highlighted when viewing different instrument.
-
-        If user is browsing a different instrument's presets, the menu
-        should start at the first preset (index 0), not the current preset
-        of the currently loaded instrument.
-        """
-        self._configure_scroller_mock(mock_scroller)
         self.mock_api.get_current_instrument.return_value = Instrument("Piano", "Piano", "#000000", "#FFFFFF")
-        self.mock_api.get_current_preset.return_value = Preset("Medium", "Medium")
-        self.mock_api.get_presets.return_value = [
-            Preset("Plucked", "Plucked"),
-            Preset("Muted", "Muted"),
-            Preset("Sustained", "Sustained")
-        ]
 
-        menu = PresetMenuDisplay(
-            self.mock_api, 128, 64, self.mock_font,
-            self.mock_on_exit, "Strings"  # Viewing different instrument
-        )
+        for description, current_preset, preset_names, viewing, expected in cases:
+            with self.subTest(description):
+                self.mock_api.get_current_preset.return_value = Preset(current_preset, current_preset)
+                self.mock_api.get_presets.return_value = [Preset(name, name) for name in preset_names]
 
-        # Should stay at default position (0) - not search for "Medium"
-        self.assertEqual(0, menu.current_menu_option)
+                menu = self._make_menu(viewing)
 
-    @patch('pi_pianoteq.client.gfxhat.menu_display.ScrollingText')
-    @patch('PIL.ImageDraw.Draw')
-    @patch('PIL.Image.new')
-    def test_current_preset_not_in_list(self, mock_image, mock_draw, mock_scroller):
-        """
-        Should handle gracefully if current preset not in list.
-
-        This is an edge case that shouldn't happen in normal operation,
-        but the code should not crash if API returns inconsistent data.
-        """
-        self.mock_api.get_current_instrument.return_value = Instrument("Piano", "Piano", "#000000", "#FFFFFF")
-        self._configure_scroller_mock(mock_scroller)
-        self.mock_api.get_current_preset.return_value = Preset("NonExistent", "NonExistent")
-        self.mock_api.get_presets.return_value = [
-            Preset("Bright", "Bright"),
-            Preset("Dark", "Dark"),
-            Preset("Medium", "Medium")
-        ]
-
-        menu = PresetMenuDisplay(
-            self.mock_api, 128, 64, self.mock_font,
-            self.mock_on_exit, "Piano"
-        )
-
-        # Should stay at default position (0) if preset not found
-        self.assertEqual(0, menu.current_menu_option)
+                self.assertEqual(expected, menu.current_menu_option)
 
-    @patch('pi_pianoteq.client.gfxhat.menu_display.ScrollingText')
-    @patch('PIL.ImageDraw.Draw')
-    @patch('PIL.Image.new')
-    def test_empty_preset_list(self, mock_image, mock_draw, mock_scroller):
+    def test_empty_preset_list(self):
         """Should handle empty preset list."""
         self.mock_api.get_presets.return_value = []
-        self._configure_scroller_mock(mock_scroller)
 
-        menu = PresetMenuDisplay(
-            self.mock_api, 128, 64, self.mock_font,
-            self.mock_on_exit, "Piano"
-        )
+        menu = self._make_menu()
 
         # Should have 0 options with no presets
         self.assertEqual(0, len(menu.menu_options))
 
-    @patch('pi_pianoteq.client.gfxhat.menu_display.ScrollingText')
-    @patch('PIL.ImageDraw.Draw')
-    @patch('PIL.Image.new')
-    def test_stores_instrument_name(self, mock_image, mock_draw, mock_scroller):
+    def test_stores_instrument_name(self):
         """Should store the instrument name for later use."""
         self.mock_api.get_presets.return_value = [Preset("Bright", "Bright")]
-        self._configure_scroller_mock(mock_scroller)
 
-        menu = PresetMenuDisplay(
-            self.mock_api, 128, 64, self.mock_font,
-            self.mock_on_exit, "TestInstrument"
-        )
+        menu = self._make_menu("TestInstrument")
 
         self.assertEqual("TestInstrument", menu.instrument_name)
 
-    @patch('pi_pianoteq.client.gfxhat.menu_display.ScrollingText')
-    @patch('PIL.ImageDraw.Draw')
-    @patch('PIL.Image.new')
     @patch('gfxhat.touch')
-    def test_ignore_first_enter_release(self, mock_touch, mock_image, mock_draw, mock_scroller):
+    def test_ignore_first_enter_release(self, mock_touch):
         """First ENTER release should be ignored to prevent spurious selection."""
         self.mock_api.get_presets.return_value = [
             Preset("Bright", "Bright"),
             Preset("Dark", "Dark")
         ]
-        self._configure_scroller_mock(mock_scroller)
         mock_touch.ENTER = 0
 
-        menu = PresetMenuDisplay(
-            self.mock_api, 128, 64, self.mock_font,
-            self.mock_on_exit, "Piano"
-        )
+        menu = self._make_menu()
 
         handler = menu.get_handler()
 
@@ -218,23 +137,16 @@ class PresetMenuDisplayTestCase(unittest.TestCase):
         self.mock_api.set_preset.assert_not_called()
         self.mock_on_exit.assert_not_called()
 
-    @patch('pi_pianoteq.client.gfxhat.menu_display.ScrollingText')
-    @patch('PIL.ImageDraw.Draw')
-    @patch('PIL.Image.new')
     @patch('gfxhat.touch')
-    def test_second_enter_release_triggers_selection(self, mock_touch, mock_image, mock_draw, mock_scroller):
+    def test_second_enter_release_triggers_selection(self, mock_touch):
         """Second ENTER release should trigger preset selection."""
         self.mock_api.get_presets.return_value = [
             Preset("Bright", "Bright"),
             Preset("Dark", "Dark")
         ]
-        self._configure_scroller_mock(mock_scroller)
         mock_touch.ENTER = 0
 
-        menu = PresetMenuDisplay(
-            self.mock_api, 128, 64, self.mock_font,
-            self.mock_on_exit, "Piano"
-        )
+        menu = self._make_menu()
 
         handler = menu.get_handler()
 
@@ -248,21 +160,14 @@ class PresetMenuDisplayTestCase(unittest.TestCase):
         self.mock_api.set_preset.assert_called_once()
         self.mock_on_exit.assert_called_once()
 
-    @patch('pi_pianoteq.client.gfxhat.menu_display.ScrollingText')
-    @patch('PIL.ImageDraw.Draw')
-    @patch('PIL.Image.new')
-    def test_preset_selected_flag_set_on_selection(self, mock_image, mock_draw, mock_scroller):
+    def test_preset_selected_flag_set_on_selection(self):
         """preset_selected flag should be set when user selects a preset."""
         self.mock_api.get_presets.return_value = [
             Preset("Bright", "Bright"),
             Preset("Dark", "Dark")
         ]
-        self._configure_scroller_mock(mock_scroller)
 
-        menu = PresetMenuDisplay(
-            self.mock_api, 128, 64, self.mock_font,
-            self.mock_on_exit, "Piano"
-        )
+        menu = self._make_menu()
 
         # Initially False
         self.assertFalse(menu.preset_selected)
@@ -273,22 +178,15 @@ class PresetMenuDisplayTestCase(unittest.TestCase):
         # Should be True
         self.assertTrue(menu.preset_selected)
 
-    @patch('pi_pianoteq.client.gfxhat.menu_display.ScrollingText')
-    @patch('PIL.ImageDraw.Draw')
-    @patch('PIL.Image.new')
-    def test_uses_display_names_but_stores_raw_names(self, mock_image, mock_draw, mock_scroller):
+    def test_uses_display_names_but_stores_raw_names(self):
         """Menu should show display names but use raw names for API calls."""
         # Piano presets have "Piano " prefix stripped in display_name
-        self._configure_scroller_mock(mock_scroller)
         self.mock_api.get_presets.return_value = [
             Preset("Piano Bright", "Bright"),
             Preset("Piano Dark", "Dark")
         ]
 
-        menu = PresetMenuDisplay(
-            self.mock_api, 128, 64, self.mock_font,
-            self.mock_on_exit, "Piano"
-        )
+        menu = self._make_menu()
 
         # Menu options should show display names (without prefix)
         self.assertEqual("Bright", menu.menu_options[0].name)
@@ -0,0 +1,32 @@
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from pi_pianoteq.config.config import ConfigLoader
+from pi_pianoteq.rpc.types import PresetInfo
+
+_BASE_PRESET = PresetInfo(name="", instr="", instrument_class="", collection="", license="",
+                          license_status="ok", author="", bank="", comment="", file="")
+
+
+def _preset(name, instr, instrument_class, license_status="ok"):
+    return replace(_BASE_PRESET, name=name, instr=instr, instrument_class=instrument_class,
+                   license_status=license_status)
+
+
+@pytest.fixture(scope="session")
+def default_config():
+    """ConfigLoader with no user config, built once and shared read-only"""
+    return ConfigLoader(config_path=Path('/nonexistent/config.conf'))
+
+
+@pytest.fixture(scope="module")
+def mock_presets():
+    """Presets as returned by get_presets(), shared read-only within a module"""
+    return (
+        _preset("Grand K2 Bright", "Grand K2", "Acoustic Piano"),
+        _preset("Grand K2 Warm", "Grand K2", "Acoustic Piano"),
+        _preset("Vintage Tines MKI", "Vintage Tines MKI", "Electric Piano"),
+        _preset("Celesta Bright", "Celesta", "Chromatic Percussion", license_status="demo"),
+    )
@@ -1,7 +1,6 @@
-import os
-import tempfile
 import json
 from pathlib import Path
+from unittest.mock import Mock
 import pytest
 
 from pi_pianoteq.config.config import (
@@ -15,10 +14,10 @@ from pi_pianoteq.config.config import (
 
 
 @pytest.fixture
-def temp_config_file():
+def temp_config_file(tmp_path):
     """Create a temporary config file for testing"""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.conf', delete=False) as f:
-        f.write("""[Pianoteq]
+    config_path = tmp_path / 'user.conf'
+    config_path.write_text("""[Pianoteq]
 PIANOTEQ_DIR = /custom/pianoteq/dir/
 PIANOTEQ_BIN = Custom Pianoteq
 PIANOTEQ_HEADLESS = true
@@ -26,28 +25,18 @@ PIANOTEQ_HEADLESS = true
 [System]
 SHUTDOWN_COMMAND = custom shutdown command
 """)
-        temp_path = Path(f.name)
-
-    yield temp_path
-
-    # Cleanup
-    temp_path.unlink()
+    return config_path
 
 
 @pytest.fixture
-def partial_config_file():
+def partial_config_file(tmp_path):
     """Create a config file with only some values set"""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.conf', delete=False) as f:
-        f.write("""[Pianoteq]
+    config_path = tmp_path / 'partial.conf'
+    config_path.write_text("""[Pianoteq]
 PIANOTEQ_DIR = /partial/pianoteq/dir/
 PIANOTEQ_BIN = Partial Pianoteq
 """)
-        temp_path = Path(f.name)
-
-    yield temp_path
-
-    # Cleanup
-    temp_path.unlink()
+    return config_path
 
 
 def test_bundled_config_exists():
@@ -55,17 +44,14 @@ def test_bundled_config_exists():
     assert BUNDLED_CONFIG_PATH.exists()
 
 
-def test_loads_bundled_default_when_no_user_config():
+def test_loads_bundled_default_when_no_user_config(default_config):
     """Test that config loads from bundled default when no user config exists"""
-    # Create config with non-existent user config path
-    config = ConfigLoader(config_path=Path('/nonexistent/config.conf'))
-
     # Should fall back to bundled defaults
-    assert config.PIANOTEQ_DIR is not None
-    assert config.SHUTDOWN_COMMAND is not None
+    assert default_config.PIANOTEQ_DIR is not None
+    assert default_config.SHUTDOWN_COMMAND is not None
 
     # All values should come from bundled default
-    sources = config.get_config_sources()
+    sources = default_config.get_config_sources()
     assert all(source == 'bundled_default' for source in sources.values())
 
 
@@ -102,70 +88,54 @@ def test_partial_user_config_merges_with_default(partial_config_file):
     assert sources['SHUTDOWN_COMMAND'] == 'bundled_default'
 
 
-def test_env_var_overrides_user_config(temp_config_file):
+def test_env_var_overrides_user_config(monkeypatch, temp_config_file):
     """Test that environment variables override user config"""
-    # Set environment variable
-    os.environ['PIANOTEQ_DIR'] = '/env/override/dir/'
-    os.environ['SHUTDOWN_COMMAND'] = 'env shutdown'
+    monkeypatch.setenv('PIANOTEQ_DIR', '/env/override/dir/')
+    monkeypatch.setenv('SHUTDOWN_COMMAND', 'env shutdown')
 
-    try:
-        config = ConfigLoader(config_path=temp_config_file)
+    config = ConfigLoader(config_path=temp_config_file)
 
-        # Env vars should override user config
-        assert config.PIANOTEQ_DIR == '/env/override/dir/'
-        assert config.SHUTDOWN_COMMAND == 'env shutdown'
+    # Env vars should override user config
+    assert config.PIANOTEQ_DIR == '/env/override/dir/'
+    assert config.SHUTDOWN_COMMAND == 'env shutdown'
 
-        # Non-overridden values still from user config
-        assert config.PIANOTEQ_BIN == 'Custom Pianoteq'
+    # Non-overridden values still from user config
+    assert config.PIANOTEQ_BIN == 'Custom Pianoteq'
 
-        # Check sources
-        sources = config.get_config_sources()
-        assert sources['PIANOTEQ_DIR'] == 'environment'
-        assert sources['SHUTDOWN_COMMAND'] == 'environment'
-        assert sources['PIANOTEQ_BIN'] == 'user_config'
-    finally:
-        # Clean up environment
-        del os.environ['PIANOTEQ_DIR']
-        del os.environ['SHUTDOWN_COMMAND']
+    # Check sources
+    sources = config.get_config_sources()
+    assert sources['PIANOTEQ_DIR'] == 'environment'
+    assert sources['SHUTDOWN_COMMAND'] == 'environment'
+    assert sources['PIANOTEQ_BIN'] == 'user_config'
 
 
-def test_env_var_overrides_default():
+def test_env_var_overrides_default(monkeypatch):
     """Test that environment variables override bundled default"""
-    os.environ['PIANOTEQ_DIR'] = '/env/dir/'
+    monkeypatch.setenv('PIANOTEQ_DIR', '/env/dir/')
 
-    try:
-        config = ConfigLoader(config_path=Path('/nonexistent/config.conf'))
+    config = ConfigLoader(config_path=Path('/nonexistent/config.conf'))
 
-        assert config.PIANOTEQ_DIR == '/env/dir/'
+    assert config.PIANOTEQ_DIR == '/env/dir/'
 
-        sources = config.get_config_sources()
-        assert sources['PIANOTEQ_DIR'] == 'environment'
-    finally:
-        del os.environ['PIANOTEQ_DIR']
+    sources = config.get_config_sources()
+    assert sources['PIANOTEQ_DIR'] == 'environment'
 
 
-def test_config_priority_all_sources(temp_config_file):
+def test_config_priority_all_sources(monkeypatch, temp_config_file):
     """Test complete priority chain: env > user > default"""
-    os.environ['PIANOTEQ_DIR'] = '/env/dir/'
+    monkeypatch.setenv('PIANOTEQ_DIR', '/env/dir/')
 
-    try:
-        config = ConfigLoader(config_path=temp_config_file)
-
-        sources = config.get_config_sources()
-
-        # Env var set: should be from environment
-        assert config.PIANOTEQ_DIR == '/env/dir/'
-        assert sources['PIANOTEQ_DIR'] == 'environment'
+    config = ConfigLoader(config_path=temp_config_file)
 
-        # In user config but no env var: should be from user_config
-        assert config.PIANOTEQ_BIN == 'Custom Pianoteq'
-        assert sources['PIANOTEQ_BIN'] == 'user_config'
+    sources = config.get_config_sources()
 
-        # Not in user config or env: should be from bundled_default
-        # (assuming these aren't in the temp_config_file or environment)
+    # Env var set: should be from environment
+    assert config.PIANOTEQ_DIR == '/env/dir/'
+    assert sources['PIANOTEQ_DIR'] == 'environment'
 
-    finally:
-        del os.environ['PIANOTEQ_DIR']
+    # In user config but no env var: should be from user_config
+    assert config.PIANOTEQ_BIN == 'Custom Pianoteq'
+    assert sources['PIANOTEQ_BIN'] == 'user_config'
 
 
 def test_boolean_config_parsing(temp_config_file):
@@ -177,11 +147,9 @@ def test_boolean_config_parsing(temp_config_file):
     assert isinstance(config.PIANOTEQ_HEADLESS, bool)
 
 
-def test_get_config_sources():
+def test_get_config_sources(default_config):
     """Test that config sources tracking works"""
-    config = ConfigLoader(config_path=Path('/nonexistent/config.conf'))
-
-    sources = config.get_config_sources()
+    sources = default_config.get_config_sources()
 
     # Should return a dict
     assert isinstance(sources, dict)
@@ -195,12 +163,10 @@ def test_get_config_sources():
     assert all(source == 'bundled_default' for source in sources.values())
 
 
-def test_config_sources_returns_copy():
+def test_config_sources_returns_copy(default_config):
     """Test that get_config_sources returns a copy, not the internal dict"""
-    config = ConfigLoader(config_path=Path('/nonexistent/config.conf'))
-
-    sources1 = config.get_config_sources()
-    sources2 = config.get_config_sources()
+    sources1 = default_config.get_config_sources()
+    sources2 = default_config.get_config_sources()
 
     # Should be equal but not the same object
     assert sources1 == sources2
@@ -220,15 +186,12 @@ def test_config_sources_returns_copy():
     ("FALSE", False),
     ("anything_else", False),
 ])
-def test_boolean_parsing_variations(env_value, expected):
+def test_boolean_parsing_variations(monkeypatch, env_value, expected):
     """Test that boolean values are parsed correctly in various formats"""
-    os.environ['PIANOTEQ_HEADLESS'] = env_value
+    monkeypatch.setenv('PIANOTEQ_HEADLESS', env_value)
 
-    try:
-        config = ConfigLoader(config_path=Path('/nonexistent/config.conf'))
-        assert config.PIANOTEQ_HEADLESS == expected
-    finally:
-        del os.environ['PIANOTEQ_HEADLESS']
+    config = ConfigLoader(config_path=Path('/nonexistent/config.conf'))
+    assert config.PIANOTEQ_HEADLESS == expected
 
 
 def test_map_instrument_to_category_known_instruments():
@@ -277,53 +240,81 @@ def test_map_instrument_to_category_new_instruments():
     assert map_instrument_to_category('Unknown Bell', 'Chromatic Percussion') == 'percussion-mallet'
 
 
-def test_map_instrument_to_category_preserves_colors():
+# All 37 original instrument -> category mappings (ensures no color is lost in migration)
+_KNOWN_MAPPINGS = {
+    'Grand C. Bechstein DG': 'piano',
+    'Grand Ant. Petrof': 'piano',
+    'Grand Steingraeber': 'piano',
+    'Grand Grotrian': 'piano',
+    'Grand Blüthner': 'piano',
+    'Grand YC5': 'piano',
+    'Grand K2': 'piano',
+    'Upright U4': 'piano',
+    'Vintage Tines MKI': 'electric-tines',
+    'Vintage Tines MKII': 'electric-tines',
+    'Vintage Reeds': 'electric-tines',
+    'Clavinet D6': 'electric-keys',
+    'Pianet N': 'electric-keys',
+    'Pianet T': 'electric-keys',
+    'Electra-Piano': 'electric-keys',
+    'Vibraphone V-B': 'vibraphone',
+    'Vibraphone V-M': 'vibraphone',
+    'Celesta': 'percussion-mallet',
+    'Glockenspiel': 'percussion-mallet',
+    'Toy Piano': 'percussion-mallet',
+    'Kalimba': 'percussion-mallet',
+    'Marimba': 'percussion-wood',
+    'Xylophone': 'percussion-wood',
+    'Steel Drum': 'percussion-metal',
+    'Spacedrum': 'percussion-metal',
+    'Hand Pan': 'percussion-metal',
+    'Tank Drum': 'percussion-metal',
+    'H. Ruckers II Harpsichord': 'harpsichord',
+    'Concert Harp': 'harp',
+    'J. Dohnal (1795)': 'historical',
+    'I. Besendorfer (1829)': 'historical',
+    'S. Erard (1849)': 'historical',
+    'J.B. Streicher (1852)': 'historical',
+    'J. Broadwood (1796)': 'historical',
+    'I. Pleyel (1835)': 'historical',
+    'J. Frenzel (1841)': 'historical',
+    'C. Bechstein (1899)': 'historical',
+}
+
+
+@pytest.mark.parametrize("instr_name,expected_category", list(_KNOWN_MAPPINGS.items()))
+def test_map_instrument_to_category_preserves_colors(instr_name, expected_category):
     """Test that all 37 original instruments are preserved"""
-    # This ensures no color is lost in migration
-    known_mappings = {
-        'Grand C. Bechstein DG': 'piano',
-        'Grand Ant. Petrof': 'piano',
-        'Grand Steingraeber': 'piano',
-        'Grand Grotrian': 'piano',
-        'Grand Blüthner': 'piano',
-        'Grand YC5': 'piano',
-        'Grand K2': 'piano',
-        'Upright U4': 'piano',
-        'Vintage Tines MKI': 'electric-tines',
-        'Vintage Tines MKII': 'electric-tines',
-        'Vintage Reeds': 'electric-tines',
-        'Clavinet D6': 'electric-keys',
-        'Pianet N': 'electric-keys',
-        'Pianet T': 'electric-keys',
-        'Electra-Piano': 'electric-keys',
-        'Vibraphone V-B': 'vibraphone',
-        'Vibraphone V-M': 'vibraphone',
-        'Celesta': 'percussion-mallet',
-        'Glockenspiel': 'percussion-mallet',
-        'Toy Piano': 'percussion-mallet',
-        'Kalimba': 'percussion-mallet',
-        'Marimba': 'percussion-wood',
-        'Xylophone': 'percussion-wood',
-        'Steel Drum': 'percussion-metal',
-        'Spacedrum': 'percussion-metal',
-        'Hand Pan': 'percussion-metal',
-        'Tank Drum': 'percussion-metal',
-        'H. Ruckers II Harpsichord': 'harpsichord',
-        'Concert Harp': 'harp',
-        'J. Dohnal (1795)': 'historical',
-        'I. Besendorfer (1829)': 'historical',
-        'S. Erard (1849)': 'historical',
-        'J.B. Streicher (1852)': 'historical',
-        'J. Broadwood (1796)': 'historical',
-        'I. Pleyel (1835)': 'historical',
-        'J. Frenzel (1841)': 'historical',
-        'C. Bechstein (1899)': 'historical',
-    }
-
-    for instr_name, expected_category in known_mappings.items():
-        # Use dummy class since known instruments are looked up by name
-        result = map_instrument_to_category(instr_name, 'Dummy Class')
-        assert result == expected_category, f"Instrument '{instr_name}' should map to '{expected_category}' but got '{result}'"
+    # Use dummy class since known instruments are looked up by name
+    assert map_instrument_to_category(instr_name, 'Dummy Class') == expected_category
+
+
+def test_discover_instruments_from_api_groups_licensed_presets(mock_presets):
+    """Test that discovery groups licensed presets by instrument with display names"""
+    mock_rpc = Mock()
+    mock_rpc.get_presets.return_value = list(mock_presets)
+
+    instruments = ConfigLoader.discover_instruments_from_api(mock_rpc)
+
+    # Demo-only instruments are skipped while licensed ones exist
+    assert [i.name for i in instruments] == ['Grand K2', 'Vintage Tines MKI']
+    assert instruments[0].background_primary == COLOR_CATEGORIES['piano'][0]
+    assert instruments[1].background_primary == COLOR_CATEGORIES['electric-tines'][0]
+
+    # Common instrument prefix is stripped from display names
+    assert [p.name for p in instruments[0].presets] == ['Grand K2 Bright', 'Grand K2 Warm']
+    assert [p.display_name for p in instruments[0].presets] == ['Bright', 'Warm']
+    assert [p.display_name for p in instruments[1].presets] == ['Default']
+
+
+def test_discover_instruments_from_api_includes_demo(mock_presets):
+    """Test that include_demo keeps instruments without a license"""
+    mock_rpc = Mock()
+    mock_rpc.get_presets.return_value = list(mock_presets)
+
+    instruments = ConfigLoader.discover_instruments_from_api(mock_rpc, include_demo=True)
+
+    assert [i.name for i in instruments] == ['Grand K2', 'Vintage Tines MKI', 'Celesta']
 
 
 def test_init_user_config_creates_file(tmp_path):
@@ -41,12 +41,13 @@ class PresetDisplayNameFieldTestCase(unittest.TestCase):
 
 
 class LibraryFindPresetTestCase(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         inst1 = Instrument(i1, i1, '#000000', '#FFFFFF')
         inst1.presets = [Preset(s1, 'Prelude'), Preset(s2, 'Jazz')]
         inst2 = Instrument(i2, i2, '#000000', '#FFFFFF')
         inst2.presets = [Preset(a1, 'Recording 1'), Preset(a2, 'Recording 2')]
-        self.library = Library([inst1, inst2])
+        cls.library = Library([inst1, inst2])
 
     def test_find_preset_by_name_first_instrument(self):
         result = self.library.find_preset_by_name(s1)
@@ -75,6 +76,29 @@ class LibraryFindPresetTestCase(unittest.TestCase):
         result = self.library.find_preset_by_name('steinway d prelude')
         self.assertIsNone(result)
 
+    def test_find_preset_by_name_ci(self):
+        result = self.library.find_preset_by_name_ci('steinway d prelude')
+        self.assertIsNotNone(result)
+        instrument, preset = result
+        self.assertEqual(i1, instrument.name)
+        self.assertEqual(s1, preset.name)
+
+    def test_find_preset_by_name_ci_not_found(self):
+        self.assertIsNone(self.library.find_preset_by_name_ci('nonexistent preset'))
+
+    def test_find_preset_by_name_after_reindex(self):
+        # Builds its own library since it mutates presets
+        instrument = Instrument(i1, i1, '#000000', '#FFFFFF')
+        instrument.presets = [Preset(s1, 'Prelude')]
+        library = Library([instrument])
+        instrument.add_preset(Preset('Steinway D Blues', 'Blues'))
+        self.assertIsNone(library.find_preset_by_name('Steinway D Blues'))
+
+        library.reindex()
+        result = library.find_preset_by_name('Steinway D Blues')
+        self.assertIsNotNone(result)
+        self.assertIs(instrument, result[0])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -6,17 +6,19 @@ from pi_pianoteq.instrument.preset import Preset
 
 
 class SelectorSetPresetByNameTestCase(unittest.TestCase):
-    def setUp(self):
-        self.inst1 = Instrument('Steinway D', 'Steinway D', '#000000', '#FFFFFF')
-        self.preset1a = Preset('Steinway D Prelude', 'Prelude')
-        self.preset1b = Preset('Steinway D Jazz', 'Jazz')
-        self.inst1.presets = [self.preset1a, self.preset1b]
-
-        self.inst2 = Instrument('Ant. Petrof', 'Ant. Petrof', '#000000', '#FFFFFF')
-        self.preset2a = Preset('Ant. Petrof Recording 1', 'Recording 1')
-        self.preset2b = Preset('Ant. Petrof Recording 2', 'Recording 2')
-        self.inst2.presets = [self.preset2a, self.preset2b]
+    @classmethod
+    def setUpClass(cls):
+        cls.inst1 = Instrument('Steinway D', 'Steinway D', '#000000', '#FFFFFF')
+        cls.preset1a = Preset('Steinway D Prelude', 'Prelude')
+        cls.preset1b = Preset('Steinway D Jazz', 'Jazz')
+        cls.inst1.presets = [cls.preset1a, cls.preset1b]
+
+        cls.inst2 = Instrument('Ant. Petrof', 'Ant. Petrof', '#000000', '#FFFFFF')
+        cls.preset2a = Preset('Ant. Petrof Recording 1', 'Recording 1')
+        cls.preset2b = Preset('Ant. Petrof Recording 2', 'Recording 2')
+        cls.inst2.presets = [cls.preset2a, cls.preset2b]
 
+    def setUp(self):
         self.selector = Selector([self.inst1, self.inst2])
 
     def test_set_preset_by_name_first_instrument_first_preset(self):
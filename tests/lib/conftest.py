@@ -0,0 +1,62 @@
+from unittest.mock import Mock
+
+import pytest
+
+from pi_pianoteq.instrument.instrument import Instrument
+from pi_pianoteq.instrument.library import Library
+from pi_pianoteq.instrument.preset import Preset
+from pi_pianoteq.instrument.selector import Selector
+from pi_pianoteq.lib.client_lib import ClientLib
+from pi_pianoteq.rpc.jsonrpc_client import PianoteqJsonRpc
+from pi_pianoteq.rpc.types import PianoteqInfo, CurrentPreset
+
+# Pianoteq state reported by get_info() unless a test sets its own
+_DEFAULT_INFO = PianoteqInfo(current_preset=CurrentPreset(name='Steinway D Prelude'))
+
+
+def _instrument(name, *presets):
+    instrument = Instrument(name, name, '#000000', '#FFFFFF')
+    instrument.presets = [Preset(f'{name} {suffix}', suffix) for suffix in presets]
+    return instrument
+
+
+@pytest.fixture(scope="module")
+def steinway_instrument():
+    """Steinway D with Prelude and Jazz presets, shared read-only within a module"""
+    return _instrument('Steinway D', 'Prelude', 'Jazz')
+
+
+@pytest.fixture(scope="module")
+def petrof_instrument():
+    """Ant. Petrof with two recording presets, shared read-only within a module"""
+    return _instrument('Ant. Petrof', 'Recording 1', 'Recording 2')
+
+
+@pytest.fixture(scope="module")
+def instruments(steinway_instrument, petrof_instrument):
+    return [steinway_instrument, petrof_instrument]
+
+
+@pytest.fixture(scope="module")
+def library(instruments):
+    return Library(instruments)
+
+
+@pytest.fixture
+def selector(instruments):
+    """Selector over the shared instruments; per test since tests move its position"""
+    return Selector(instruments)
+
+
+@pytest.fixture
+def jsonrpc():
+    """Fresh jsonrpc mock per test, reporting the first Steinway preset as current"""
+    jsonrpc = Mock(spec=PianoteqJsonRpc)
+    jsonrpc.get_info.return_value = _DEFAULT_INFO
+    return jsonrpc
+
+
+@pytest.fixture
+def client_lib(library, selector, jsonrpc):
+    """ClientLib synced at startup to the default Steinway D Prelude preset"""
+    return ClientLib(library, selector, jsonrpc)
@@ -1,21 +1,26 @@
 """Tests for Pianoteq process management."""
 
-import time
+import subprocess
 import unittest
-from unittest.mock import Mock, MagicMock, patch, call
+from unittest.mock import Mock, patch
 
 from pi_pianoteq.process.pianoteq import Pianoteq
-from pi_pianoteq.rpc.jsonrpc_client import PianoteqJsonRpcError
+from pi_pianoteq.rpc.jsonrpc_client import PianoteqJsonRpc, PianoteqJsonRpcError
 
 
 class TestPianoteqQuit(unittest.TestCase):
     """Test Pianoteq quit() method for graceful shutdown."""
 
+    @classmethod
+    def setUpClass(cls):
+        patcher = patch('pi_pianoteq.process.pianoteq.Config')
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
     def setUp(self):
         """Set up test fixtures."""
-        self.mock_jsonrpc = Mock()
-        with patch('pi_pianoteq.process.pianoteq.Config'):
-            self.pianoteq = Pianoteq(jsonrpc_client=self.mock_jsonrpc)
+        self.mock_jsonrpc = Mock(spec=PianoteqJsonRpc)
+        self.pianoteq = Pianoteq(jsonrpc_client=self.mock_jsonrpc)
 
     def test_quit_with_no_process(self):
         """Test quit() handles case when process is None."""
@@ -39,34 +44,28 @@ class TestPianoteqQuit(unittest.TestCase):
         self.mock_jsonrpc.quit.assert_not_called()
         mock_process.terminate.assert_not_called()
 
-    @patch('pi_pianoteq.process.pianoteq.time.sleep')
-    def test_quit_graceful_success(self, mock_sleep):
+    def test_quit_graceful_success(self):
         """Test quit() successfully quits via JSON-RPC."""
         mock_process = Mock()
         mock_process.returncode = None
-        mock_process.poll.side_effect = [None, None, 0]  # Exits on third poll
+        mock_process.wait.return_value = 0  # Exits within the timeout
         self.pianoteq.process = mock_process
 
         self.pianoteq.quit(timeout=5.0)
 
         # Should send quit command
         self.mock_jsonrpc.quit.assert_called_once()
-        # Should poll process
-        self.assertEqual(mock_process.poll.call_count, 3)
+        # Should wait for the process with the graceful timeout
+        mock_process.wait.assert_called_once_with(timeout=5.0)
         # Should not terminate since graceful quit succeeded
         mock_process.terminate.assert_not_called()
 
-    @patch('pi_pianoteq.process.pianoteq.time.sleep')
-    @patch('pi_pianoteq.process.pianoteq.time.time')
-    def test_quit_graceful_timeout_fallback_to_terminate(self, mock_time, mock_sleep):
+    def test_quit_graceful_timeout_fallback_to_terminate(self):
         """Test quit() falls back to terminate() if graceful quit times out."""
-        # Mock time to simulate timeout
-        # Need enough values for quit() loop + terminate() loop
-        mock_time.side_effect = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]
-
         mock_process = Mock()
         mock_process.returncode = None
-        mock_process.poll.side_effect = [None, None, None, None, None, None, 0]  # Exits on terminate
+        # Times out after quit, exits on terminate
+        mock_process.wait.side_effect = [subprocess.TimeoutExpired('pianoteq', 5.0), 0]
         self.pianoteq.process = mock_process
 
         self.pianoteq.quit(timeout=5.0)
@@ -75,13 +74,13 @@ class TestPianoteqQuit(unittest.TestCase):
         self.mock_jsonrpc.quit.assert_called_once()
         # Should fall back to terminate
         mock_process.terminate.assert_called_once()
+        mock_process.kill.assert_not_called()
 
-    @patch('pi_pianoteq.process.pianoteq.time.sleep')
-    def test_quit_jsonrpc_error_with_delayed_exit(self, mock_sleep):
+    def test_quit_jsonrpc_error_with_delayed_exit(self):
         """Test quit() handles JSON-RPC error and waits for process to exit."""
         mock_process = Mock()
         mock_process.returncode = None
-        mock_process.poll.side_effect = [None, None, 0]  # Process exits after a few polls
+        mock_process.wait.return_value = 0  # Process exits within the timeout
         self.pianoteq.process = mock_process
 
         # Simulate JSON-RPC error (expected when Pianoteq closes connection)
@@ -91,16 +90,15 @@ class TestPianoteqQuit(unittest.TestCase):
 
         # Should attempt quit command
         self.mock_jsonrpc.quit.assert_called_once()
-        # Should poll process and see it exited, no need to terminate
-        self.assertEqual(mock_process.poll.call_count, 3)
+        # Should wait for process and see it exited, no need to terminate
+        mock_process.wait.assert_called_once_with(timeout=5.0)
         mock_process.terminate.assert_not_called()
 
-    @patch('pi_pianoteq.process.pianoteq.time.sleep')
-    def test_quit_jsonrpc_connection_closes_immediately(self, mock_sleep):
+    def test_quit_jsonrpc_connection_closes_immediately(self):
         """Test quit() handles Pianoteq closing connection immediately."""
         mock_process = Mock()
         mock_process.returncode = None
-        mock_process.poll.return_value = 0  # Process exits immediately
+        mock_process.wait.return_value = 0  # Process exits immediately
         self.pianoteq.process = mock_process
 
         # Simulate connection close (expected behavior)
@@ -111,17 +109,16 @@ class TestPianoteqQuit(unittest.TestCase):
         # Should attempt quit command (even if it errors)
         self.mock_jsonrpc.quit.assert_called_once()
         # Process exits immediately, so should not need terminate
-        mock_process.poll.assert_called_once()
+        mock_process.wait.assert_called_once()
         mock_process.terminate.assert_not_called()
 
     def test_quit_without_jsonrpc_client(self):
         """Test quit() falls back to terminate() when no JSON-RPC client."""
-        with patch('pi_pianoteq.process.pianoteq.Config'):
-            pianoteq = Pianoteq(jsonrpc_client=None)
+        pianoteq = Pianoteq(jsonrpc_client=None)
 
         mock_process = Mock()
         mock_process.returncode = None
-        mock_process.poll.return_value = 0
+        mock_process.wait.return_value = 0
         pianoteq.process = mock_process
 
         pianoteq.quit()
@@ -129,12 +126,11 @@ class TestPianoteqQuit(unittest.TestCase):
         # Should fall back to terminate immediately
         mock_process.terminate.assert_called_once()
 
-    @patch('pi_pianoteq.process.pianoteq.time.sleep')
-    def test_quit_exception_during_jsonrpc_fallback_to_terminate(self, mock_sleep):
+    def test_quit_exception_during_jsonrpc_fallback_to_terminate(self):
         """Test quit() handles unexpected exceptions during JSON-RPC call."""
         mock_process = Mock()
         mock_process.returncode = None
-        mock_process.poll.return_value = 0
+        mock_process.wait.return_value = 0
         self.pianoteq.process = mock_process
 
         # Simulate unexpected error
@@ -149,10 +145,15 @@ class TestPianoteqQuit(unittest.TestCase):
 class TestPianoteqTerminate(unittest.TestCase):
     """Test Pianoteq terminate() method."""
 
+    @classmethod
+    def setUpClass(cls):
+        patcher = patch('pi_pianoteq.process.pianoteq.Config')
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
     def setUp(self):
         """Set up test fixtures."""
-        with patch('pi_pianoteq.process.pianoteq.Config'):
-            self.pianoteq = Pianoteq()
+        self.pianoteq = Pianoteq()
 
     def test_terminate_with_no_process(self):
         """Test terminate() handles case when process is None."""
@@ -173,33 +174,28 @@ class TestPianoteqTerminate(unittest.TestCase):
         mock_process.terminate.assert_not_called()
         mock_process.kill.assert_not_called()
 
-    @patch('pi_pianoteq.process.pianoteq.time.sleep')
-    def test_terminate_success_with_sigterm(self, mock_sleep):
+    def test_terminate_success_with_sigterm(self):
         """Test terminate() successfully terminates with SIGTERM."""
         mock_process = Mock()
         mock_process.returncode = None
-        mock_process.poll.side_effect = [None, None, 0]  # Exits on third poll
+        mock_process.wait.return_value = 0  # Exits within the timeout
         self.pianoteq.process = mock_process
 
         self.pianoteq.terminate(timeout=3.0)
 
         # Should call terminate (SIGTERM)
         mock_process.terminate.assert_called_once()
-        # Should poll process
-        self.assertEqual(mock_process.poll.call_count, 3)
+        # Should wait for process with the terminate timeout
+        mock_process.wait.assert_called_once_with(timeout=3.0)
         # Should not need kill (SIGKILL)
         mock_process.kill.assert_not_called()
 
-    @patch('pi_pianoteq.process.pianoteq.time.sleep')
-    @patch('pi_pianoteq.process.pianoteq.time.time')
-    def test_terminate_timeout_fallback_to_sigkill(self, mock_time, mock_sleep):
+    def test_terminate_timeout_fallback_to_sigkill(self):
         """Test terminate() falls back to SIGKILL if SIGTERM times out."""
-        # Mock time to simulate timeout
-        mock_time.side_effect = [0, 1, 2, 3, 4]  # Exceeds 3 second timeout
-
         mock_process = Mock()
         mock_process.returncode = None
-        mock_process.poll.return_value = None  # Never exits on poll
+        # Ignores SIGTERM, exits on SIGKILL
+        mock_process.wait.side_effect = [subprocess.TimeoutExpired('pianoteq', 3.0), 0]
         self.pianoteq.process = mock_process
 
         self.pianoteq.terminate(timeout=3.0)
@@ -208,15 +204,15 @@ class TestPianoteqTerminate(unittest.TestCase):
         mock_process.terminate.assert_called_once()
         # Should fall back to kill (SIGKILL)
         mock_process.kill.assert_called_once()
-        # Should wait for process to die
-        mock_process.wait.assert_called_once()
+        # Should wait for process to die after kill
+        self.assertEqual(mock_process.wait.call_count, 2)
+        self.assertEqual(mock_process.wait.call_args.kwargs, {})
 
-    @patch('pi_pianoteq.process.pianoteq.time.sleep')
-    def test_terminate_immediate_exit(self, mock_sleep):
+    def test_terminate_immediate_exit(self):
         """Test terminate() handles immediate process exit."""
         mock_process = Mock()
         mock_process.returncode = None
-        mock_process.poll.return_value = 0  # Exits immediately
+        mock_process.wait.return_value = 0  # Exits immediately
         self.pianoteq.process = mock_process
 
         self.pianoteq.terminate(timeout=3.0)
@@ -225,21 +221,26 @@ class TestPianoteqTerminate(unittest.TestCase):
         mock_process.terminate.assert_called_once()
         # Should not need kill
         mock_process.kill.assert_not_called()
-        mock_process.wait.assert_not_called()
+        mock_process.wait.assert_called_once_with(timeout=3.0)
 
 
 class TestPianoteqInvertedLogicFix(unittest.TestCase):
     """Test that the inverted logic bug in terminate() is fixed."""
 
+    @classmethod
+    def setUpClass(cls):
+        patcher = patch('pi_pianoteq.process.pianoteq.Config')
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
     def test_terminate_correctly_checks_returncode_is_none(self):
         """Verify terminate() checks if process is still running (returncode is None)."""
-        with patch('pi_pianoteq.process.pianoteq.Config'):
-            pianoteq = Pianoteq()
+        pianoteq = Pianoteq()
 
         # Test 1: Process still running (returncode is None)
         mock_process = Mock()
         mock_process.returncode = None  # Process is still running
-        mock_process.poll.return_value = 0  # Will exit immediately
+        mock_process.wait.return_value = 0  # Will exit immediately
         pianoteq.process = mock_process
 
         pianoteq.terminate()
@@ -249,8 +250,7 @@ class TestPianoteqInvertedLogicFix(unittest.TestCase):
 
     def test_terminate_skips_already_exited_process(self):
         """Verify terminate() skips process when already exited (returncode is not None)."""
-        with patch('pi_pianoteq.process.pianoteq.Config'):
-            pianoteq = Pianoteq()
+        pianoteq = Pianoteq()
 
         # Test 2: Process already exited (returncode is not None)
         mock_process = Mock()
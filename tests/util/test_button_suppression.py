@@ -1,56 +1,92 @@
 import unittest
-import time
 
 from pi_pianoteq.util.button_suppression import ButtonSuppression
 
 
+class FakeClock:
+    """Monotonic nanosecond clock that only moves when advanced"""
+
+    def __init__(self):
+        self.now_ns = 1_000_000_000
+
+    def __call__(self):
+        return self.now_ns
+
+    def advance_ms(self, ms):
+        self.now_ns += ms * 1_000_000
+
+
 class ButtonSuppressionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
     def test_initial_state_allows_action(self):
         """Without any record() call, allow_action should return True"""
-        suppression = ButtonSuppression(300)
+        suppression = ButtonSuppression(300, clock=self.clock)
         self.assertTrue(suppression.allow_action())
 
     def test_immediate_action_after_record_is_blocked(self):
         """Immediately after record(), allow_action should return False"""
-        suppression = ButtonSuppression(300)
+        suppression = ButtonSuppression(300, clock=self.clock)
         suppression.record()
         self.assertFalse(suppression.allow_action())
 
     def test_action_allowed_after_threshold(self):
         """After threshold time has elapsed, allow_action should return True"""
-        suppression = ButtonSuppression(100)  # 100ms threshold for faster test
+        suppression = ButtonSuppression(100, clock=self.clock)
+        suppression.record()
+        self.clock.advance_ms(120)  # 120ms > 100ms threshold
+        self.assertTrue(suppression.allow_action())
+
+    def test_action_allowed_exactly_at_threshold(self):
+        """The window closes once exactly threshold_ms has elapsed"""
+        suppression = ButtonSuppression(100, clock=self.clock)
         suppression.record()
-        time.sleep(0.12)  # 120ms > 100ms threshold
+        self.clock.advance_ms(100)
         self.assertTrue(suppression.allow_action())
 
     def test_action_blocked_before_threshold(self):
         """Before threshold time elapses, allow_action should return False"""
-        suppression = ButtonSuppression(200)
+        suppression = ButtonSuppression(200, clock=self.clock)
         suppression.record()
-        time.sleep(0.05)  # 50ms < 200ms threshold
+        self.clock.advance_ms(50)  # 50ms < 200ms threshold
         self.assertFalse(suppression.allow_action())
 
     def test_custom_threshold(self):
         """Suppression should respect custom threshold values"""
-        suppression = ButtonSuppression(50)
+        suppression = ButtonSuppression(50, clock=self.clock)
         suppression.record()
-        time.sleep(0.06)  # 60ms > 50ms threshold
+        self.clock.advance_ms(60)  # 60ms > 50ms threshold
         self.assertTrue(suppression.allow_action())
 
     def test_multiple_records_reset_timer(self):
         """Multiple record() calls should reset the timer"""
-        suppression = ButtonSuppression(100)
+        suppression = ButtonSuppression(100, clock=self.clock)
         suppression.record()
-        time.sleep(0.06)  # 60ms elapsed
+        self.clock.advance_ms(60)  # 60ms elapsed
         suppression.record()  # Reset timer
-        # Now only ~0ms has elapsed since last record()
+        self.clock.advance_ms(60)  # 120ms since first record(), 60ms since last
         self.assertFalse(suppression.allow_action())
 
+    def test_threshold_change_applies_to_open_window(self):
+        """Changing threshold_ms after construction takes effect immediately"""
+        suppression = ButtonSuppression(300, clock=self.clock)
+        suppression.record()
+        self.clock.advance_ms(60)
+        suppression.threshold_ms = 50
+        self.assertTrue(suppression.allow_action())
+
     def test_default_threshold_value(self):
         """Default threshold should be 300ms"""
         suppression = ButtonSuppression()
         self.assertEqual(300, suppression.threshold_ms)
 
+    def test_default_clock_blocks_immediately_after_record(self):
+        """The default monotonic clock opens a real suppression window"""
+        suppression = ButtonSuppression(300)
+        suppression.record()
+        self.assertFalse(suppression.allow_action())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,85 +1,49 @@
-import unittest
+import pytest
 
 from pi_pianoteq.util.preset_names import find_longest_common_word_prefix, calculate_display_name
 
 
-class CommonPrefixTestCase(unittest.TestCase):
-    def test_simple_common_prefix(self):
-        names = ['W1 roomy', 'W1 Logical', 'W1 - bright']
-        self.assertEqual('W1', find_longest_common_word_prefix(names))
-
-    def test_multi_word_prefix(self):
-        names = ['Steel Drum natural', 'Steel Drum bright', 'Steel Drum warm']
-        self.assertEqual('Steel Drum', find_longest_common_word_prefix(names))
-
-    def test_no_common_prefix(self):
-        names = ['Foo', 'Bar', 'Baz']
-        self.assertEqual('', find_longest_common_word_prefix(names))
-
-    def test_single_preset(self):
-        names = ['W1 roomy']
-        self.assertEqual('W1 roomy', find_longest_common_word_prefix(names))
-
-    def test_empty_list(self):
-        names = []
-        self.assertEqual('', find_longest_common_word_prefix(names))
-
-    def test_case_insensitive_matching(self):
-        names = ['W1 roomy', 'w1 Logical', 'W1 bright']
-        self.assertEqual('W1', find_longest_common_word_prefix(names))
-
-    def test_mixed_separators(self):
-        names = ['Hand Pan - foo', 'Hand Pan bar', 'Hand Pan: baz']
-        self.assertEqual('Hand Pan', find_longest_common_word_prefix(names))
-
-    def test_partial_word_not_matched(self):
-        names = ['W1foo', 'W1bar']
-        self.assertEqual('', find_longest_common_word_prefix(names))
-
-
-class CalculateDisplayNameTestCase(unittest.TestCase):
-    def test_strip_prefix_with_space_separator(self):
-        self.assertEqual('Natural', calculate_display_name('Steel Drum natural', 'Steel Drum'))
-
-    def test_strip_prefix_with_hyphen_separator(self):
-        self.assertEqual('Natural, foo', calculate_display_name('Hand Pan - natural, foo', 'Hand Pan'))
-
-    def test_strip_prefix_case_insensitive(self):
-        self.assertEqual('Natural', calculate_display_name('steel drum natural', 'Steel Drum'))
-
-    def test_strip_prefix_with_em_dash(self):
-        self.assertEqual('Natural', calculate_display_name('Hand Pan — natural', 'Hand Pan'))
-
-    def test_strip_prefix_with_colon(self):
-        self.assertEqual('Concert', calculate_display_name('Grotrian: Concert', 'Grotrian'))
-
-    def test_exact_match_returns_default(self):
-        self.assertEqual('Default', calculate_display_name('Steel Drum', 'Steel Drum'))
-
-    def test_no_match_returns_original(self):
-        self.assertEqual('Different Name', calculate_display_name('Different Name', 'Steel Drum'))
-
-    def test_multiple_word_result(self):
-        self.assertEqual('Recording 1', calculate_display_name('Ant. Petrof Recording 1', 'Ant. Petrof'))
-
-    def test_single_letter_capitalization(self):
-        self.assertEqual('A', calculate_display_name('Grotrian a', 'Grotrian'))
-
-    def test_empty_prefix_capitalizes_name(self):
-        self.assertEqual('Natural', calculate_display_name('natural', ''))
-
-    def test_example_from_issue(self):
-        # Test the examples from the issue
-        self.assertEqual('Roomy', calculate_display_name('W1 roomy', 'W1'))
-        self.assertEqual('Logical', calculate_display_name('W1 Logical', 'W1'))
-        self.assertEqual('Bright', calculate_display_name('W1 - bright', 'W1'))
-
-    def test_hyphenated_instrument_name(self):
-        # Test instrument names with hyphens like "SK-EX"
-        # The prefix normalizes to spaces but preset has hyphens
-        self.assertEqual('Classic', calculate_display_name('Grand Shigeru Kawai SK-EX Classic', 'Grand Shigeru Kawai SK EX'))
-        self.assertEqual('Recording', calculate_display_name('Grand Shigeru Kawai SK-EX Recording', 'Grand Shigeru Kawai SK EX'))
-
-
-if __name__ == '__main__':
-    unittest.main()
+@pytest.mark.parametrize("names, expected", [
+    pytest.param(['W1 roomy', 'W1 Logical', 'W1 - bright'], 'W1', id="simple_common_prefix"),
+    pytest.param(['Steel Drum natural', 'Steel Drum bright', 'Steel Drum warm'], 'Steel Drum',
+                 id="multi_word_prefix"),
+    pytest.param(['Foo', 'Bar', 'Baz'], '', id="no_common_prefix"),
+    pytest.param(['W1 roomy'], 'W1 roomy', id="single_preset"),
+    pytest.param([], '', id="empty_list"),
+    pytest.param(['W1 roomy', 'w1 Logical', 'W1 bright'], 'W1', id="case_insensitive_matching"),
+    pytest.param(['Hand Pan - foo', 'Hand Pan bar', 'Hand Pan: baz'], 'Hand Pan', id="mixed_separators"),
+    pytest.param(['W1foo', 'W1bar'], '', id="partial_word_not_matched"),
+    pytest.param(['- A b', '- A c'], 'A', id="leading_separator_ignored"),
+    pytest.param(['Steel Drum -', 'Steel Drum bright'], 'Steel Drum', id="trailing_separator_ignored"),
+])
+def test_find_longest_common_word_prefix(names, expected):
+    assert find_longest_common_word_prefix(names) == expected
+
+
+@pytest.mark.parametrize("preset_name, common_prefix, expected", [
+    pytest.param('Steel Drum natural', 'Steel Drum', 'Natural', id="strip_prefix_with_space_separator"),
+    pytest.param('Hand Pan - natural, foo', 'Hand Pan', 'Natural, foo', id="strip_prefix_with_hyphen_separator"),
+    pytest.param('steel drum natural', 'Steel Drum', 'Natural', id="strip_prefix_case_insensitive"),
+    pytest.param('Hand Pan — natural', 'Hand Pan', 'Natural', id="strip_prefix_with_em_dash"),
+    pytest.param('Grotrian: Concert', 'Grotrian', 'Concert', id="strip_prefix_with_colon"),
+    pytest.param('Celesta – warm', 'Celesta', 'Warm', id="strip_prefix_with_en_dash"),
+    pytest.param('Celesta | warm', 'Celesta', 'Warm', id="strip_prefix_with_pipe"),
+    pytest.param('Steel Drum', 'Steel Drum', 'Default', id="exact_match_returns_default"),
+    pytest.param('Steel Drum -', 'Steel Drum', 'Default', id="trailing_separator_returns_default"),
+    pytest.param('- Steel Drum bright', 'Steel Drum', 'Bright', id="leading_separator_ignored"),
+    pytest.param('Different Name', 'Steel Drum', 'Different Name', id="no_match_returns_original"),
+    pytest.param('Ant. Petrof Recording 1', 'Ant. Petrof', 'Recording 1', id="multiple_word_result"),
+    pytest.param('Grotrian a', 'Grotrian', 'A', id="single_letter_capitalization"),
+    pytest.param('natural', '', 'Natural', id="empty_prefix_capitalizes_name"),
+    # Examples from the issue
+    pytest.param('W1 roomy', 'W1', 'Roomy', id="issue_example_roomy"),
+    pytest.param('W1 Logical', 'W1', 'Logical', id="issue_example_logical"),
+    pytest.param('W1 - bright', 'W1', 'Bright', id="issue_example_bright"),
+    # Instrument names with hyphens like "SK-EX": the prefix normalizes to spaces but the preset has hyphens
+    pytest.param('Grand Shigeru Kawai SK-EX Classic', 'Grand Shigeru Kawai SK EX', 'Classic',
+                 id="hyphenated_instrument_name_classic"),
+    pytest.param('Grand Shigeru Kawai SK-EX Recording', 'Grand Shigeru Kawai SK EX', 'Recording',
+                 id="hyphenated_instrument_name_recording"),
+])
+def test_calculate_display_name(preset_name, common_prefix, expected):
+    assert calculate_display_name(preset_name, common_prefix) == expected